@@ -105,6 +105,15 @@ TE_DMM = [int(0), False]
 """ SSRs"""
 TE_SSR = [int(0), False]
 
+""" Optional strand / evidence source split """
+SPLIT_STRAND_SOURCE = False
+""" Wicker codes hit by the current element """
+ELEMENT_HITS = []
+""" (Wicker code, strand, source) hit at the current bp """
+BP_SPLIT_HITS = set()
+""" # of bp covered per (Wicker code, strand, source) """
+SPLIT_COVERAGE = {}
+
 ###
 # End global variables
 ###
@@ -117,8 +126,10 @@ def usage():
      sys.stderr.write("\nclassification_te_coverage.py expects\
                        \n\t(1) path to GFF3 file for contig of interest\
                        \n\t(2) TEannot project_name (from TEannot.cfg)\
+                       \n\t(3) optional: --split to also write coverage by strand and evidence source\
                        \nExample usage:\
-                       \n\tpython classification_te_coverage.py ./test_data/chromosome_2.gff3 sbi1\n\n")
+                       \n\tpython classification_te_coverage.py ./test_data/chromosome_2.gff3 sbi1\
+                       \n\tpython classification_te_coverage.py ./test_data/chromosome_2.gff3 sbi1 --split\n\n")
      sys.stderr.flush()
      sys.exit()
 
@@ -134,6 +145,8 @@ if len(sys.argv) <= 2:
      usage()
 if sys.argv[1] == "--help" or sys.argv[1] == "-h":
      usage()
+if "--split" in sys.argv[3:]:
+     SPLIT_STRAND_SOURCE = True
 
 # Read input gff3 file.
 try:
@@ -148,15 +161,20 @@ except IOError:
      usage()
 
 # Populate genomic array of sets
+# Each entry is "<type>@<class or ID>@<strand>@<evidence source>" so that strand
+# and source can be recovered in the same pass as the classification.
 print("Populating genomic array of sets.")
 GAS = HTSeq.GenomicArrayOfSets( [CONTIG_ID], stranded=False )
 for t_element in itertools.islice(GFF3_FILE,0,None):
+   strand_source = "@" + t_element.iv.strand + "@"
    if t_element.source == PROJECT_NAME + "_REPET_TEs":
-      GAS[t_element.iv] += "TE@" + (t_element.attr['Target'])[:3]
-   elif t_element.source == PROJECT_NAME + "_REPET_tblastx" or t_element.source == PROJECT_NAME + "_REPET_blastx":
-      GAS[t_element.iv] += "blast@" + t_element.attr['ID']
+      GAS[t_element.iv] += "TE@" + (t_element.attr['Target'])[:3] + strand_source + "REPET_TEs"
+   elif t_element.source == PROJECT_NAME + "_REPET_tblastx":
+      GAS[t_element.iv] += "blast@" + t_element.attr['ID'] + strand_source + "tblastx"
+   elif t_element.source == PROJECT_NAME + "_REPET_blastx":
+      GAS[t_element.iv] += "blast@" + t_element.attr['ID'] + strand_source + "blastx"
    elif t_element.source == PROJECT_NAME + "_REPET_SSRs":
-      GAS[t_element.iv] += "SSR@" + t_element.attr['ID']
+      GAS[t_element.iv] += "SSR@" + t_element.attr['ID'] + strand_source + "SSR"
 print("Finished populating genomic array of sets.")
 
 ###
@@ -165,206 +183,247 @@ print("Finished populating genomic array of sets.")
 
 for bp_position in range(1, CONTIG_LENGTH):
    for t_element in list(GAS[HTSeq.GenomicPosition(CONTIG_ID, bp_position)]):
+      ELEMENT_HITS = []
       if t_element.split("@")[0] == "TE":
          wickers_class = t_element.split("@")[1]
          if list(wickers_class)[0] == "R":
             """ Class I (retrotransposons)"""
+            ELEMENT_HITS.append("RXX")
             if TE_RXX[INDEX_CHANGE] == False:
                TE_RXX[INDEX_COVERAGE] = int(1) + TE_RXX[INDEX_COVERAGE]
                TE_RXX[INDEX_CHANGE] = True
             if list(wickers_class)[1] == "L":
                """ Order LTR """
+               ELEMENT_HITS.append("RLX")
                if TE_RLX[INDEX_CHANGE] == False:
                   TE_RLX[INDEX_COVERAGE] = int(1) + TE_RLX[INDEX_COVERAGE]
                   TE_RLX[INDEX_CHANGE] = True
                if list(wickers_class)[2] == "C":
                   """ Superfamily Copia """
+                  ELEMENT_HITS.append("RLC")
                   if TE_RLC[INDEX_CHANGE] == False:
                      TE_RLC[INDEX_COVERAGE] = int(1) + TE_RLC[INDEX_COVERAGE]
                      TE_RLC[INDEX_CHANGE] = True
                elif list(wickers_class)[2] == "G":
                   """ Superfamily Gypsy """
+                  ELEMENT_HITS.append("RLG")
                   if TE_RLG[INDEX_CHANGE] == False:
                      TE_RLG[INDEX_COVERAGE] = int(1) + TE_RLG[INDEX_COVERAGE]
                      TE_RLG[INDEX_CHANGE] = True
                elif list(wickers_class)[2] == "G":
                   """ Superfamily Bel-Pao """
+                  ELEMENT_HITS.append("RLB")
                   if TE_RLB[INDEX_CHANGE] == False:
                      TE_RLB[INDEX_COVERAGE] = int(1) + TE_RLB[INDEX_COVERAGE]
                      TE_RLB[INDEX_CHANGE] = True
                elif list(wickers_class)[2] == "R":
                   """ Superfamily Retrovirus """
+                  ELEMENT_HITS.append("RLR")
                   if TE_RLR[INDEX_CHANGE] == False:
                      TE_RLR[INDEX_COVERAGE] = int(1) + TE_RLR[INDEX_COVERAGE]
                      TE_RLR[INDEX_CHANGE] = True
                elif list(wickers_class)[2] == "E":
                   """ Superfamily ERV """
+                  ELEMENT_HITS.append("RLE")
                   if TE_RLE[INDEX_CHANGE] == False:
                      TE_RLE[INDEX_COVERAGE] = int(1) + TE_RLE[INDEX_COVERAGE]
                      TE_RLE[INDEX_CHANGE] = True
             elif list(wickers_class)[1] == "Y":
                """ Order DIRS """
+               ELEMENT_HITS.append("RYX")
                if TE_RYX[INDEX_CHANGE] == False:
                   TE_RYX[INDEX_COVERAGE] = int(1) + TE_RYX[INDEX_COVERAGE]
                   TE_RYX[INDEX_CHANGE] = True
                if list(wickers_class)[2] == "D":
                   """ Superfamily DIRS """
+                  ELEMENT_HITS.append("RYD")
                   if TE_RYD[INDEX_CHANGE] == False:
                      TE_RYD[INDEX_COVERAGE] = int(1) + TE_RYD[INDEX_COVERAGE]
                      TE_RYD[INDEX_CHANGE] = True
                elif list(wickers_class)[2] == "N":
                   """ Superfamily Ngaro """
+                  ELEMENT_HITS.append("RYN")
                   if TE_RYN[INDEX_CHANGE] == False:
                      TE_RYN[INDEX_COVERAGE] = int(1) + TE_RYN[INDEX_COVERAGE]
                      TE_RYN[INDEX_CHANGE] = True
                elif list(wickers_class)[2] == "E":
                   """ Superfamily VIPER """
+                  ELEMENT_HITS.append("RYV")
                   if TE_RYV[INDEX_CHANGE] == False:
                      TE_RYV[INDEX_COVERAGE] = int(1) + TE_RYV[INDEX_COVERAGE]
                      TE_RYV[INDEX_CHANGE] = True
             elif list(wickers_class)[1] == "P":
                """ Order PLE """
+               ELEMENT_HITS.append("RPX")
                if TE_RPX[INDEX_CHANGE] == False:
                   TE_RPX[INDEX_COVERAGE] = int(1) + TE_RPX[INDEX_COVERAGE]
                   TE_RPX[INDEX_CHANGE] = True
                if list(wickers_class)[2] == "P":
                   """ Superfamily Penelope """
+                  ELEMENT_HITS.append("RPP")
                   if TE_RPP[INDEX_CHANGE] == False:
                      TE_RPP[INDEX_COVERAGE] = int(1) + TE_RPP[INDEX_COVERAGE]
                      TE_RPP[INDEX_CHANGE] = True
             elif list(wickers_class)[1] == "I":
                """ Order LINE """
+               ELEMENT_HITS.append("RIX")
                if TE_RIX[INDEX_CHANGE] == False:
                   TE_RIX[INDEX_COVERAGE] = int(1) + TE_RIX[INDEX_COVERAGE]
                   TE_RIX[INDEX_CHANGE] = True
                if list(wickers_class)[2] == "R":
                   """ Superfamily R2 """
+                  ELEMENT_HITS.append("RIR")
                   if TE_RIR[INDEX_CHANGE] == False:
                      TE_RIR[INDEX_COVERAGE] = int(1) + TE_RIR[INDEX_COVERAGE]
                      TE_RIR[INDEX_CHANGE] = True
                elif list(wickers_class)[2] == "T":
                   """ Superfamily RTE """
+                  ELEMENT_HITS.append("RIT")
                   if TE_RIT[INDEX_CHANGE] == False:
                      TE_RIT[INDEX_COVERAGE] = int(1) + TE_RIT[INDEX_COVERAGE]
                      TE_RIT[INDEX_CHANGE] = True
                elif list(wickers_class)[2] == "J":
                   """ Superfamily Jockey """
+                  ELEMENT_HITS.append("RIJ")
                   if TE_RIJ[INDEX_CHANGE] == False:
                      TE_RIJ[INDEX_COVERAGE] = int(1) + TE_RIJ[INDEX_COVERAGE]
                      TE_RIJ[INDEX_CHANGE] = True
                elif list(wickers_class)[2] == "L":
                   """ Superfamily L1 """
+                  ELEMENT_HITS.append("RIL")
                   if TE_RIL[INDEX_CHANGE] == False:
                      TE_RIL[INDEX_COVERAGE] = int(1) + TE_RIL[INDEX_COVERAGE]
                      TE_RIL[INDEX_CHANGE] = True
                elif list(wickers_class)[2] == "I":
                   """ Superfamily I """
+                  ELEMENT_HITS.append("RII")
                   if TE_RII[INDEX_CHANGE] == False:
                      TE_RII[INDEX_COVERAGE] = int(1) + TE_RII[INDEX_COVERAGE]
                      TE_RII[INDEX_CHANGE] = True
             elif list(wickers_class)[1] == "S":
                """ Order SINE """
+               ELEMENT_HITS.append("RSX")
                if TE_RSX[INDEX_CHANGE] == False:
                   TE_RSX[INDEX_COVERAGE] = int(1) + TE_RSX[INDEX_COVERAGE]
                   TE_RSX[INDEX_CHANGE] = True
                if list(wickers_class)[2] == "T":
                   """ Superfamily tRNA """
+                  ELEMENT_HITS.append("RST")
                   if TE_RST[INDEX_CHANGE] == False:
                      TE_RST[INDEX_COVERAGE] = int(1) + TE_RST[INDEX_COVERAGE]
                      TE_RST[INDEX_CHANGE] = True
                elif list(wickers_class)[2] == "L":
                   """ Superfamily 7SL """
+                  ELEMENT_HITS.append("RSL")
                   if TE_RSL[INDEX_CHANGE] == False:
                      TE_RSL[INDEX_COVERAGE] = int(1) + TE_RSL[INDEX_COVERAGE]
                      TE_RSL[INDEX_CHANGE] = True
                elif list(wickers_class)[2] == "S":
                   """ Superfamily 5S """
+                  ELEMENT_HITS.append("RSS")
                   if TE_RSS[INDEX_CHANGE] == False:
                      TE_RSS[INDEX_COVERAGE] = int(1) + TE_RSS[INDEX_COVERAGE]
                      TE_RSS[INDEX_CHANGE] = True
          elif list(wickers_class)[0] == "D":
             """ Class II (DNA transposons)"""
+            ELEMENT_HITS.append("DXX")
             if TE_DXX[INDEX_CHANGE] == False: 
                TE_DXX[INDEX_COVERAGE] = int(1) + TE_DXX[INDEX_COVERAGE]
                TE_DXX[INDEX_CHANGE] = True
                wickers_class = t_element.split("@")[1]
             if list(wickers_class)[1] == "T":
                """ Subclass I: Order TIR """
+               ELEMENT_HITS.append("DTX")
                if TE_DTX[INDEX_CHANGE] == False:
                   TE_DTX[INDEX_COVERAGE] = int(1) + TE_DTX[INDEX_COVERAGE]
                   TE_DTX[INDEX_CHANGE] = True
                if list(wickers_class)[2] == "T":
                   """ Superfamily Tc1-Mariner """
+                  ELEMENT_HITS.append("DTT")
                   if TE_DTT[INDEX_CHANGE] == False:
                      TE_DTT[INDEX_COVERAGE] = int(1) + TE_DTT[INDEX_COVERAGE]
                      TE_DTT[INDEX_CHANGE] = True
                elif list(wickers_class)[2] == "A":
                   """ Superfamily hAT """
+                  ELEMENT_HITS.append("DTA")
                   if TE_DTA[INDEX_CHANGE] == False:
                      TE_DTA[INDEX_COVERAGE] = int(1) + TE_DTA[INDEX_COVERAGE]
                      TE_DTA[INDEX_CHANGE] = True
                elif list(wickers_class)[2] == "M":
                   """ Superfamily Mutator """
+                  ELEMENT_HITS.append("DTM")
                   if TE_DTM[INDEX_CHANGE] == False:
                      TE_DTM[INDEX_COVERAGE] = int(1) + TE_DTM[INDEX_COVERAGE]
                      TE_DTM[INDEX_CHANGE] = True
                elif list(wickers_class)[2] == "E":
                   """ Superfamily Merlin """
+                  ELEMENT_HITS.append("DTE")
                   if TE_DTE[INDEX_CHANGE] == False:
                      TE_DTE[INDEX_COVERAGE] = int(1) + TE_DTE[INDEX_COVERAGE]
                      TE_DTE[INDEX_CHANGE] = True
                elif list(wickers_class)[2] == "R":
                   """ Superfamily Transib """
+                  ELEMENT_HITS.append("DTR")
                   if TE_DTR[INDEX_CHANGE] == False:
                      TE_DTR[INDEX_COVERAGE] = int(1) + TE_DTR[INDEX_COVERAGE]
                      TE_DTR[INDEX_CHANGE] = True
                elif list(wickers_class)[2] == "P":
                   """ Superfamily P """
+                  ELEMENT_HITS.append("DTP")
                   if TE_DTP[INDEX_CHANGE] == False:
                      TE_DTP[INDEX_COVERAGE] = int(1) + TE_DTP[INDEX_COVERAGE]
                      TE_DTP[INDEX_CHANGE] = True
                elif list(wickers_class)[2] == "B":
                   """ Superfamily PiggyBac """
+                  ELEMENT_HITS.append("DTB")
                   if TE_DTB[INDEX_CHANGE] == False:
                      TE_DTB[INDEX_COVERAGE] = int(1) + TE_DTB[INDEX_COVERAGE]
                      TE_DTB[INDEX_CHANGE] = True
                elif list(wickers_class)[2] == "H":
                   """ Superfamily F-Harbinger """
+                  ELEMENT_HITS.append("DTH")
                   if TE_DTH[INDEX_CHANGE] == False:
                      TE_DTH[INDEX_COVERAGE] = int(1) + TE_DTH[INDEX_COVERAGE]
                      TE_DTH[INDEX_CHANGE] = True
                elif list(wickers_class)[2] == "C":
                   """ Superfamily CACTA """
+                  ELEMENT_HITS.append("DTC")
                   if TE_DTC[INDEX_CHANGE] == False:
                      TE_DTC[INDEX_COVERAGE] = int(1) + TE_DTC[INDEX_COVERAGE]
                      TE_DTC[INDEX_CHANGE] = True
             if list(wickers_class)[1] == "T":
                """ Subclass I: Order Crypton """
+               ELEMENT_HITS.append("DYX")
                if TE_DYX[INDEX_CHANGE] == False:
                   TE_DYX[INDEX_COVERAGE] = int(1) + TE_DYX[INDEX_COVERAGE]
                   TE_DYX[INDEX_CHANGE] = True
                if list(wickers_class)[2] == "T":
                   """ Superfamily Crypton """
+                  ELEMENT_HITS.append("DYC")
                   if TE_DYC[INDEX_CHANGE] == False:
                      TE_DYC[INDEX_COVERAGE] = int(1) + TE_DYC[INDEX_COVERAGE]
                      TE_DYC[INDEX_CHANGE] = True
             elif list(wickers_class)[1] == "H":
                """ Subclass I: Order Helitron """
+               ELEMENT_HITS.append("DHX")
                if TE_DHX[INDEX_CHANGE] == False:
                   TE_DHX[INDEX_COVERAGE] = int(1) + TE_DHX[INDEX_COVERAGE]
                   TE_DHX[INDEX_CHANGE] = True
                if list(wickers_class)[2] == "H":
                   """ Superfamily Helitron """
+                  ELEMENT_HITS.append("DHH")
                   if TE_DHH[INDEX_CHANGE] == False:
                      TE_DHH[INDEX_COVERAGE] = int(1) + TE_DHH[INDEX_COVERAGE]
                      TE_DHH[INDEX_CHANGE] = True
             elif list(wickers_class)[1] == "H":
                """ Subclass II: Order Maverick """
+               ELEMENT_HITS.append("DMX")
                if TE_DMX[INDEX_CHANGE] == False:
                   TE_DMX[INDEX_COVERAGE] = int(1) + TE_DMX[INDEX_COVERAGE]
                   TE_DMX[INDEX_CHANGE] = True
                if list(wickers_class)[2] == "H":
                   """ Superfamily Maverick """
+                  ELEMENT_HITS.append("DMM")
                   if TE_DMM[INDEX_CHANGE] == False:
                      TE_DMM[INDEX_COVERAGE] = int(1) + TE_DMM[INDEX_COVERAGE]
                      TE_DMM[INDEX_CHANGE] = True
@@ -373,209 +432,256 @@ for bp_position in range(1, CONTIG_LENGTH):
          wickers_class = wickers_class.split(":")
          if (wickers_class)[1] == "ClassI":
             """ Class I (retrotransposons)"""
+            ELEMENT_HITS.append("RXX")
             if TE_RXX[INDEX_CHANGE] == False: 
                TE_RXX[INDEX_COVERAGE] = int(1) + TE_RXX[INDEX_COVERAGE]
                TE_RXX[INDEX_CHANGE] = True       
             if (wickers_class)[2] == "LTR":
                """ Order LTR """
+               ELEMENT_HITS.append("RLX")
                if TE_RLX[INDEX_CHANGE] == False:
                   TE_RLX[INDEX_COVERAGE] = int(1) + TE_RLX[INDEX_COVERAGE]
                   TE_RLX[INDEX_CHANGE] = True
                if (wickers_class)[3] == "Copia":
                   """ Superfamily Copia """
+                  ELEMENT_HITS.append("RLC")
                   if TE_RLC[INDEX_CHANGE] == False:
                      TE_RLC[INDEX_COVERAGE] = int(1) + TE_RLC[INDEX_COVERAGE]
                      TE_RLC[INDEX_CHANGE] = True
                elif (wickers_class)[3] == "Gypsy":
                   """ Superfamily Gypsy """
+                  ELEMENT_HITS.append("RLG")
                   if TE_RLG[INDEX_CHANGE] == False:
                      TE_RLG[INDEX_COVERAGE] = int(1) + TE_RLG[INDEX_COVERAGE]
                      TE_RLG[INDEX_CHANGE] = True
                elif (wickers_class)[3] == "Bel-Pao":
                   """ Superfamily Bel-Pao """
+                  ELEMENT_HITS.append("RLB")
                   if TE_RLB[INDEX_CHANGE] == False:
                      TE_RLB[INDEX_COVERAGE] = int(1) + TE_RLB[INDEX_COVERAGE]
                      TE_RLB[INDEX_CHANGE] = True
                elif (wickers_class)[3] == "Retrovirus":
                   """ Superfamily Retrovirus """
+                  ELEMENT_HITS.append("RLR")
                   if TE_RLR[INDEX_CHANGE] == False:
                      TE_RLR[INDEX_COVERAGE] = int(1) + TE_RLR[INDEX_COVERAGE]
                      TE_RLR[INDEX_CHANGE] = True
                elif (wickers_class)[3] == "ERV":
                   """ Superfamily ERV """
+                  ELEMENT_HITS.append("RLE")
                   if TE_RLE[INDEX_CHANGE] == False:
                      TE_RLE[INDEX_COVERAGE] = int(1) + TE_RLE[INDEX_COVERAGE]
                      TE_RLE[INDEX_CHANGE] = True
             elif (wickers_class)[2] == "DIRS":
                """ Order DIRS """
+               ELEMENT_HITS.append("RYX")
                if TE_RYX[INDEX_CHANGE] == False:
                   TE_RYX[INDEX_COVERAGE] = int(1) + TE_RYX[INDEX_COVERAGE]
                   TE_RYX[INDEX_CHANGE] = True
                if (wickers_class)[3] == "DIRS":
                   """ Superfamily DIRS """
+                  ELEMENT_HITS.append("RYD")
                   if TE_RYD[INDEX_CHANGE] == False:
                      TE_RYD[INDEX_COVERAGE] = int(1) + TE_RYD[INDEX_COVERAGE]
                      TE_RYD[INDEX_CHANGE] = True
                elif (wickers_class)[3] == "Ngaro":
                   """ Superfamily Ngaro """
+                  ELEMENT_HITS.append("RYN")
                   if TE_RYN[INDEX_CHANGE] == False:
                      TE_RYN[INDEX_COVERAGE] = int(1) + TE_RYN[INDEX_COVERAGE]
                      TE_RYN[INDEX_CHANGE] = True
                elif (wickers_class)[3] == "VIPER":
                   """ Superfamily VIPER """
+                  ELEMENT_HITS.append("RYV")
                   if TE_RYV[INDEX_CHANGE] == False:
                      TE_RYV[INDEX_COVERAGE] = int(1) + TE_RYV[INDEX_COVERAGE]
                      TE_RYV[INDEX_CHANGE] = True
             elif (wickers_class)[2] == "PLE":
                """ Order PLE """
+               ELEMENT_HITS.append("RPX")
                if TE_RPX[INDEX_CHANGE] == False:
                   TE_RPX[INDEX_COVERAGE] = int(1) + TE_RPX[INDEX_COVERAGE]
                   TE_RPX[INDEX_CHANGE] = True
                if (wickers_class)[3] == "Penelope":
                   """ Superfamily Penelope """
+                  ELEMENT_HITS.append("RPP")
                   if TE_RPP[INDEX_CHANGE] == False:
                      TE_RPP[INDEX_COVERAGE] = int(1) + TE_RPP[INDEX_COVERAGE]
                      TE_RPP[INDEX_CHANGE] = True
             elif (wickers_class)[2] == "LINE":
                """ Order LINE """
+               ELEMENT_HITS.append("RIX")
                if TE_RIX[INDEX_CHANGE] == False:
                   TE_RIX[INDEX_COVERAGE] = int(1) + TE_RIX[INDEX_COVERAGE]
                   TE_RIX[INDEX_CHANGE] = True
                if (wickers_class)[3] == "R2":
                   """ Superfamily R2 """
+                  ELEMENT_HITS.append("RIR")
                   if TE_RIR[INDEX_CHANGE] == False:
                      TE_RIR[INDEX_COVERAGE] = int(1) + TE_RIR[INDEX_COVERAGE]
                      TE_RIR[INDEX_CHANGE] = True
                elif (wickers_class)[3] == "RTE":
                   """ Superfamily RTE """
+                  ELEMENT_HITS.append("RIT")
                   if TE_RIT[INDEX_CHANGE] == False:
                      TE_RIT[INDEX_COVERAGE] = int(1) + TE_RIT[INDEX_COVERAGE]
                      TE_RIT[INDEX_CHANGE] = True
                elif (wickers_class)[3] == "Jockey":
                   """ Superfamily Jockey """
+                  ELEMENT_HITS.append("RIJ")
                   if TE_RIJ[INDEX_CHANGE] == False:
                      TE_RIJ[INDEX_COVERAGE] = int(1) + TE_RIJ[INDEX_COVERAGE]
                      TE_RIJ[INDEX_CHANGE] = True
                elif (wickers_class)[3] == "L1":
                   """ Superfamily L1 """
+                  ELEMENT_HITS.append("RIL")
                   if TE_RIL[INDEX_CHANGE] == False:
                      TE_RIL[INDEX_COVERAGE] = int(1) + TE_RIL[INDEX_COVERAGE]
                      TE_RIL[INDEX_CHANGE] = True
                elif (wickers_class)[3] == "I":
                   """ Superfamily I """
+                  ELEMENT_HITS.append("RII")
                   if TE_RII[INDEX_CHANGE] == False:
                      TE_RII[INDEX_COVERAGE] = int(1) + TE_RII[INDEX_COVERAGE]
                      TE_RII[INDEX_CHANGE] = True
             elif (wickers_class)[2] == "SINE":
                """ Order SINE """
+               ELEMENT_HITS.append("RSX")
                if TE_RSX[INDEX_CHANGE] == False:
                   TE_RSX[INDEX_COVERAGE] = int(1) + TE_RSX[INDEX_COVERAGE]
                   TE_RSX[INDEX_CHANGE] = True
                if (wickers_class)[3] == "tRNA":
                   """ Superfamily tRNA """
+                  ELEMENT_HITS.append("RST")
                   if TE_RST[INDEX_CHANGE] == False:
                      TE_RST[INDEX_COVERAGE] = int(1) + TE_RST[INDEX_COVERAGE]
                      TE_RST[INDEX_CHANGE] = True
                elif (wickers_class)[3] == "7SL":
                   """ Superfamily 7SL """
+                  ELEMENT_HITS.append("RSL")
                   if TE_RSL[INDEX_CHANGE] == False:
                      TE_RSL[INDEX_COVERAGE] = int(1) + TE_RSL[INDEX_COVERAGE]
                      TE_RSL[INDEX_CHANGE] = True
                elif (wickers_class)[3] == "5S":
                   """ Superfamily 5S """
+                  ELEMENT_HITS.append("RSS")
                   if TE_RSS[INDEX_CHANGE] == False:
                      TE_RSS[INDEX_COVERAGE] = int(1) + TE_RSS[INDEX_COVERAGE]
                      TE_RSS[INDEX_CHANGE] = True
          if (wickers_class)[1] == "ClassII":
             """ Class II (DNA transposons)"""
+            ELEMENT_HITS.append("DXX")
             if TE_DXX[INDEX_CHANGE] == False: 
                TE_DXX[INDEX_COVERAGE] = int(1) + TE_DXX[INDEX_COVERAGE]
                TE_DXX[INDEX_CHANGE] = True
             if (wickers_class)[2] == "TIR":
                """ Subclass I: Order TIR """
+               ELEMENT_HITS.append("DTX")
                if TE_DTX[INDEX_CHANGE] == False:
                   TE_DTX[INDEX_COVERAGE] = int(1) + TE_DTX[INDEX_COVERAGE]
                   TE_DTX[INDEX_CHANGE] = True
                if (wickers_class)[3] == "Tc1-Mariner":
                   """ Superfamily Tc1-Mariner """
+                  ELEMENT_HITS.append("DTT")
                   if TE_DTT[INDEX_CHANGE] == False:
                      TE_DTT[INDEX_COVERAGE] = int(1) + TE_DTT[INDEX_COVERAGE]
                      TE_DTT[INDEX_CHANGE] = True
                elif (wickers_class)[3] == "hAT":
                   """ Superfamily hAT """
+                  ELEMENT_HITS.append("DTA")
                   if TE_DTA[INDEX_CHANGE] == False:
                      TE_DTA[INDEX_COVERAGE] = int(1) + TE_DTA[INDEX_COVERAGE]
                      TE_DTA[INDEX_CHANGE] = True
                elif (wickers_class)[3] == "Mutator":
                   """ Superfamily Mutator """
+                  ELEMENT_HITS.append("DTM")
                   if TE_DTM[INDEX_CHANGE] == False:
                      TE_DTM[INDEX_COVERAGE] = int(1) + TE_DTM[INDEX_COVERAGE]
                      TE_DTM[INDEX_CHANGE] = True
                elif (wickers_class)[3] == "Merlin":
                   """ Superfamily Merlin """
+                  ELEMENT_HITS.append("DTE")
                   if TE_DTE[INDEX_CHANGE] == False:
                      TE_DTE[INDEX_COVERAGE] = int(1) + TE_DTE[INDEX_COVERAGE]
                      TE_DTE[INDEX_CHANGE] = True
                elif (wickers_class)[3] == "Transib":
                   """ Superfamily Transib """
+                  ELEMENT_HITS.append("DTR")
                   if TE_DTR[INDEX_CHANGE] == False:
                      TE_DTR[INDEX_COVERAGE] = int(1) + TE_DTR[INDEX_COVERAGE]
                      TE_DTR[INDEX_CHANGE] = True
                elif (wickers_class)[3] == "P":
                   """ Superfamily P """
+                  ELEMENT_HITS.append("DTP")
                   if TE_DTP[INDEX_CHANGE] == False:
                      TE_DTP[INDEX_COVERAGE] = int(1) + TE_DTP[INDEX_COVERAGE]
                      TE_DTP[INDEX_CHANGE] = True
                elif (wickers_class)[3] == "PiggyBac":
                   """ Superfamily PiggyBac """
+                  ELEMENT_HITS.append("DTB")
                   if TE_DTB[INDEX_CHANGE] == False:
                      TE_DTB[INDEX_COVERAGE] = int(1) + TE_DTB[INDEX_COVERAGE]
                      TE_DTB[INDEX_CHANGE] = True
                elif (wickers_class)[3] == "F-Harbinger":
                   """ Superfamily F-Harbinger """
+                  ELEMENT_HITS.append("DTH")
                   if TE_DTH[INDEX_CHANGE] == False:
                      TE_DTH[INDEX_COVERAGE] = int(1) + TE_DTH[INDEX_COVERAGE]
                      TE_DTH[INDEX_CHANGE] = True
                elif (wickers_class)[3] == "CACTA":
                   """ Superfamily CACTA """
+                  ELEMENT_HITS.append("DTC")
                   if TE_DTC[INDEX_CHANGE] == False:
                      TE_DTC[INDEX_COVERAGE] = int(1) + TE_DTC[INDEX_COVERAGE]
                      TE_DTC[INDEX_CHANGE] = True
             if (wickers_class)[2] == "Crypton":
                """ Subclass I: Order Crypton """
+               ELEMENT_HITS.append("DYX")
                if TE_DYX[INDEX_CHANGE] == False:
                   TE_DYX[INDEX_COVERAGE] = int(1) + TE_DYX[INDEX_COVERAGE]
                   TE_DYX[INDEX_CHANGE] = True
                if (wickers_class)[3] == "Crypton":
                   """ Superfamily Crypton """
+                  ELEMENT_HITS.append("DYC")
                   if TE_DYC[INDEX_CHANGE] == False:
                      TE_DYC[INDEX_COVERAGE] = int(1) + TE_DYC[INDEX_COVERAGE]
                      TE_DYC[INDEX_CHANGE] = True
             elif (wickers_class)[2] == "Helitron":
                """ Subclass I: Order Helitron """
+               ELEMENT_HITS.append("DHX")
                if TE_DHX[INDEX_CHANGE] == False:
                   TE_DHX[INDEX_COVERAGE] = int(1) + TE_DHX[INDEX_COVERAGE]
                   TE_DHX[INDEX_CHANGE] = True
                if (wickers_class)[3] == "Helitron":
                   """ Superfamily Helitron """
+                  ELEMENT_HITS.append("DHH")
                   if TE_DHH[INDEX_CHANGE] == False:
                      TE_DHH[INDEX_COVERAGE] = int(1) + TE_DHH[INDEX_COVERAGE]
                      TE_DHH[INDEX_CHANGE] = True
             elif (wickers_class)[2] == "Maverick ":
                """ Subclass II: Order Maverick """
+               ELEMENT_HITS.append("DMX")
                if TE_DMX[INDEX_CHANGE] == False:
                   TE_DMX[INDEX_COVERAGE] = int(1) + TE_DMX[INDEX_COVERAGE]
                   TE_DMX[INDEX_CHANGE] = True
                if (wickers_class)[3] == "Maverick":
                   """ Superfamily Maverick """
+                  ELEMENT_HITS.append("DMM")
                   if TE_DMM[INDEX_CHANGE] == False:
                      TE_DMM[INDEX_COVERAGE] = int(1) + TE_DMM[INDEX_COVERAGE]
                      TE_DMM[INDEX_CHANGE] = True
       elif t_element.split("@")[0] == "SSR":
          """ SSRs """
+         ELEMENT_HITS.append("SSR")
          if TE_SSR[INDEX_CHANGE] == False: 
             TE_SSR[INDEX_COVERAGE] = int(1) + TE_SSR[INDEX_COVERAGE]
             TE_SSR[INDEX_CHANGE] = True
+      if SPLIT_STRAND_SOURCE:
+         for wickers_code in ELEMENT_HITS:
+            BP_SPLIT_HITS.add((wickers_code, t_element.split("@")[-2], t_element.split("@")[-1]))
+   for split_key in BP_SPLIT_HITS:
+      SPLIT_COVERAGE[split_key] = int(1) + SPLIT_COVERAGE.get(split_key, int(0))
+   BP_SPLIT_HITS.clear()
    TE_RXX[INDEX_CHANGE] = False
    TE_RLX[INDEX_CHANGE] = False
    TE_RLC[INDEX_CHANGE] = False
@@ -667,6 +773,14 @@ with open(ALL_TE_BP_COVERAGE_DATA_FILE_NAME, 'w') as FILE:
    FILE.write(",Subclass I: Order Maverick,, " + str(TE_DMX[INDEX_COVERAGE]) + "\n")
    FILE.write(",,Superfamily Maverick, " + str(TE_DMM[INDEX_COVERAGE]) + "\n")
    FILE.write("SSRs,,, " + str(TE_SSR[INDEX_COVERAGE]) + "\n")
+
+# Write strand / evidence source split as a long-format comma separated value file
+if SPLIT_STRAND_SOURCE:
+   STRAND_SOURCE_COVERAGE_DATA_FILE_NAME = CONTIG_ID + '_strand_source_te_bp_coverage_data.txt'
+   with open(STRAND_SOURCE_COVERAGE_DATA_FILE_NAME, 'w') as FILE:
+      FILE.write("Wicker code, Strand, Source, # of bp covered\n")
+      for split_key in sorted(SPLIT_COVERAGE):
+         FILE.write(", ".join(split_key) + ", " + str(SPLIT_COVERAGE[split_key]) + "\n")
 ###
 # End main()
 ###